@@ -25,9 +25,18 @@ Usage:
     # Create a collection of orders
     orders_collection = Orders()
 
-    # Add an order to the collection. The sum of buy/sell orders with the best price is displayed at each step.
-    orders_collection.add_order(order)
+    # Add an order to the collection. The ID and total price of the best order of its transaction type are returned.
+    best_id, best_total = orders_collection.add_order(order)
+
+    # Add an order and display the order with the best price of the same transaction type.
+    orders_collection.add_order(order, verbose=True)
+
+    # Display the buy/sell orders with the best price.
+    orders_collection.display_best()
 """
+import heapq
+import math
+import sys
 from enum import Enum
 
 
@@ -38,6 +47,8 @@ class Product:
         name (str): The name of the product.
         price (float): The price of the product.
     """
+    __slots__ = ('name', 'price')
+
     def __init__(self, name: str, price: float):
         """Initialize a Product object.
 
@@ -55,6 +66,12 @@ class TransactionType(Enum):
     SELL = 'Sell'
 
 
+_TT_INDEX = {transaction_type: index for index, transaction_type in enumerate(TransactionType)}
+_BEST_ORDER_TEMPLATES = tuple(
+    f'Best {transaction_type.value} Order: ID = {{}}, Price = {{}}\n' for transaction_type in _TT_INDEX
+)
+
+
 class OrderType(Enum):
     """Enumeration for order types: Add or Remove."""
     ADD = 'Add'
@@ -65,14 +82,19 @@ class Order:
     """Class representing an order for a product.
 
     Attributes:
-        products (dict): A dictionary representing the products associated with the order.
-            Format: {'name'(str): price(float),...}
+        products (dict): A copy of the products associated with the order.
+            Format: {product(Product): quantity(int), ...}
         transaction_type (TransactionType): The type of transaction, either Buy or Sell.
         order_type (OrderType): The type of order, either Add or Remove.
+        total (float): The total price of the order, computed once at creation.
+            Later changes to the price of a product do not change the total.
+        _line_totals (tuple): The price times quantity of each product, frozen at creation.
 
     Raises:
         TypeError: If an invalid transaction_type or order_type is provided.
     """
+    __slots__ = ('products', 'transaction_type', 'order_type', 'total', '_line_totals')
+
     def __init__(self, products: dict, transaction_type: TransactionType, order_type: OrderType):
         """
 
@@ -82,30 +104,48 @@ class Order:
             transaction_type (TransactionType): The type of transaction, either Buy or Sell.
             order_type (OrderType): The type of order, either Add or Remove.
         """
-        if transaction_type not in TransactionType.__members__.values():
+        if not isinstance(transaction_type, TransactionType):
             raise TypeError('Invalid transaction type. It should be "Buy" or "Sell".')
-        if order_type not in OrderType.__members__.values():
+        if not isinstance(order_type, OrderType):
             raise TypeError('Invalid order type. It should be "Add" or "Remove".')
 
-        self.products = products
+        self.products = dict(products)
         self.transaction_type = transaction_type
         self.order_type = order_type
+        self._line_totals = tuple(product.price * quantity for product, quantity in products.items())
+        self.total = math.fsum(self._line_totals)
 
 
 class Orders:
     """Class representing a collection of orders.
 
     Attributes:
-        orders (dict): A dictionary containing orders, where keys are order IDs and values are Order objects.
+        orders (list): A list containing Order objects, where the ID of an order is its index plus one.
+            Removed orders are kept in the list, so the IDs of the other orders do not change.
+        _best_id (list): The ID of the best order for each transaction type, indexed by _TT_INDEX.
+            An ID of 0 means there is no order of that transaction type.
+        _best_total (list): The total price of the best order for each transaction type, indexed by _TT_INDEX.
+        _heaps (list): A heap of the orders of each transaction type, indexed by _TT_INDEX.
+            Format: [[(-total(float), order_id(int)), ...], ...]
+        _removed (set): The IDs of the removed orders. They are dropped from the heaps once they reach the top.
 
     Methods:
         _get_next_id(): Private method to get the next available order ID.
-        add_order(order: Order): Adds a new order to the collection.
-        display_order_with_a_best_price(): Displays the best order for each transaction type based on total price.
+        _recompute_best(index: int): Private method to find the best order of a transaction type in its heap.
+        add_order(order: Order, verbose: bool): Adds a new order to the collection.
+        bulk_add(orders: list, verbose: bool): Adds many orders to the collection at once.
+        remove_order(order_id: int, verbose: bool): Removes an order from the collection.
+        recompute_all(): Rebuilds the best orders from all the orders in the collection.
+        display_best(transaction_type: TransactionType): Displays the best orders by transaction type.
+        display_order_with_a_best_price(): Displays the best order for each transaction type.
     """
     def __init__(self):
-        """Initialize an Orders object with an empty orders dictionary."""
-        self.orders = {}
+        """Initialize an Orders object with an empty orders list."""
+        self.orders = []
+        self._best_id = [0] * len(_TT_INDEX)
+        self._best_total = [float('-inf')] * len(_TT_INDEX)
+        self._heaps = [[] for _ in _TT_INDEX]
+        self._removed = set()
 
     def _get_next_id(self) -> int:
         """Private method to get the next available order ID.
@@ -115,28 +155,157 @@ class Orders:
         """
         return len(self.orders) + 1
 
-    def add_order(self, order: Order):
+    def _recompute_best(self, index: int):
+        """Private method to find the best order of a transaction type in its heap.
+
+        Removed orders are popped from the top of the heap first. Orders with the same total are ordered
+        by ID, so the earliest of them remains the best one.
+
+        Args:
+            index (int): The index of the transaction type in _TT_INDEX.
+        """
+        heap = self._heaps[index]
+        while heap and heap[0][1] in self._removed:
+            heapq.heappop(heap)
+
+        if heap:
+            self._best_total[index] = -heap[0][0]
+            self._best_id[index] = heap[0][1]
+        else:
+            self._best_total[index] = float('-inf')
+            self._best_id[index] = 0
+
+    def add_order(self, order: Order, verbose: bool = False) -> tuple:
         """Add a new order to the collection.
 
          Args:
              order (Order): The Order object to be added.
+             verbose (bool): Whether to display the best order of the added order's transaction type.
+
+         Returns:
+             tuple: The ID and total price of the best order of the added order's transaction type.
+
+         Raises:
+             ValueError: If the order is not an "Add" order.
          """
-        self.orders[self._get_next_id()] = order
-        self.display_order_with_a_best_price()
+        if order.order_type is not OrderType.ADD:
+            raise ValueError('Invalid order type. Only "Add" orders can be added.')
 
-    def display_order_with_a_best_price(self):
-        """Display the best order for each transaction type based on total price."""
-        result = {}
-        for order_id, order in self.orders.items():
-            total_sum = 0
-            for product, quantity in order.products.items():
-                total_sum += quantity * product.price
-
-            if not result.get(order.transaction_type):
-                result[order.transaction_type] = [order_id, total_sum]
+        orders = self.orders
+        orders.append(order)
+        order_id = len(orders)
+        total = order.total
+        index = _TT_INDEX[order.transaction_type]
+        heapq.heappush(self._heaps[index], (-total, order_id))
+
+        best_id = self._best_id
+        best_total = self._best_total
+        if best_total[index] < total:
+            best_total[index] = total
+            best_id[index] = order_id
+
+        if verbose:
+            self.display_best(order.transaction_type)
+        return best_id[index], best_total[index]
+
+    def bulk_add(self, orders: list, verbose: bool = False):
+        """Add many orders to the collection at once.
+
+        The new orders are pushed onto the heaps one by one, unless there are more of them than orders
+        already in the heap, in which case the heap is rebuilt with heapify.
+
+        Args:
+            orders (list): A list or any other iterable of Order objects to be added.
+            verbose (bool): Whether to display the best orders after all the orders are added.
+
+        Raises:
+            ValueError: If any of the orders is not an "Add" order. No order is added in that case.
+        """
+        orders = list(orders)
+        if any(order.order_type is not OrderType.ADD for order in orders):
+            raise ValueError('Invalid order type. Only "Add" orders can be added.')
+
+        new_entries = [[] for _ in _TT_INDEX]
+        for order in orders:
+            self.orders.append(order)
+            new_entries[_TT_INDEX[order.transaction_type]].append((-order.total, len(self.orders)))
+
+        for index, entries in enumerate(new_entries):
+            if not entries:
+                continue
+            heap = self._heaps[index]
+            if len(entries) > len(heap):
+                heap.extend(entries)
+                heapq.heapify(heap)
             else:
-                if result[order.transaction_type][1] < total_sum:
-                    result[order.transaction_type] = [order_id, total_sum]
+                for entry in entries:
+                    heapq.heappush(heap, entry)
+
+            negative_total, order_id = min(entries)
+            if self._best_total[index] < -negative_total:
+                self._best_total[index] = -negative_total
+                self._best_id[index] = order_id
+        if verbose:
+            self.display_best()
+
+    def remove_order(self, order_id: int, verbose: bool = False) -> tuple:
+        """Remove an order from the collection.
+
+        Args:
+            order_id (int): The ID of the order to be removed.
+            verbose (bool): Whether to display the best order of the removed order's transaction type.
+
+        Returns:
+            tuple: The ID and total price of the best order of the removed order's transaction type.
+                The ID is 0 if no order of that transaction type is left.
 
-        for transaction_type, details in result.items():
-            print(f'Best {transaction_type.value} Order: ID = {details[0]}, Price = {details[1]}')
+        Raises:
+            ValueError: If there is no order with the given ID in the collection.
+        """
+        if not isinstance(order_id, int) or not 0 < order_id <= len(self.orders) or order_id in self._removed:
+            raise ValueError('Invalid order ID. There is no order with this ID.')
+
+        self._removed.add(order_id)
+        transaction_type = self.orders[order_id - 1].transaction_type
+        index = _TT_INDEX[transaction_type]
+        if self._best_id[index] == order_id:
+            self._recompute_best(index)
+        if verbose:
+            self.display_best(transaction_type)
+        return self._best_id[index], self._best_total[index]
+
+    def recompute_all(self):
+        """Rebuild the heaps and the best orders from all the orders in the collection.
+
+        Removed orders are left out of the new heaps, so this also frees the entries of removed orders
+        that are not at the top of a heap.
+        """
+        self._heaps = [[] for _ in _TT_INDEX]
+        for order_id, order in enumerate(self.orders, start=1):
+            if order_id not in self._removed:
+                self._heaps[_TT_INDEX[order.transaction_type]].append((-order.total, order_id))
+
+        for index, heap in enumerate(self._heaps):
+            heapq.heapify(heap)
+            self._recompute_best(index)
+
+    def display_best(self, transaction_type: TransactionType = None):
+        """Display the best order for each transaction type based on total price.
+
+        Args:
+            transaction_type (TransactionType): The transaction type to display the best order for.
+                If None, the best orders of all transaction types are displayed.
+        """
+        indexes = _TT_INDEX.values() if transaction_type is None else (_TT_INDEX[transaction_type],)
+        sys.stdout.write(''.join(
+            _BEST_ORDER_TEMPLATES[index].format(self._best_id[index], self._best_total[index])
+            for index in indexes
+            if self._best_id[index]
+        ))
+
+    def display_order_with_a_best_price(self):
+        """Display the best order for each transaction type based on total price.
+
+        Kept for backward compatibility, use display_best() instead.
+        """
+        self.display_best()
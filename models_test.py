@@ -1,4 +1,7 @@
 """The collections of the tests for the 'models.py' module."""
+import copy
+import pickle
+
 import pytest
 
 from models import Product, TransactionType, OrderType, Order, Orders
@@ -68,6 +71,47 @@ def test_valid_order_creation(fixture_products: dict, transaction_type: Transact
     assert order.order_type == order_type
 
 
+def test_order_snapshot(fixture_products: dict):
+    """Test that an order is not affected by changes made after its creation.
+
+    Args:
+        fixture_products (dict): A dictionary representing products associated with the order.
+
+    Test that changing the products dictionary or the price of a product does not change
+    the products or the total price of an existing order.
+    """
+    order = Order(fixture_products, TransactionType.BUY, OrderType.ADD)
+    products = dict(fixture_products)
+    total = order.total
+
+    next(iter(fixture_products)).price = 1000.0
+    fixture_products[Product('Cherry', 3.0)] = 5
+
+    assert order.total == total
+    assert order.products == products
+
+
+@pytest.mark.parametrize('copy_order', (lambda order: pickle.loads(pickle.dumps(order)), copy.deepcopy))
+def test_order_copy(fixture_products: dict, copy_order: callable):
+    """Test pickling and deep-copying an order.
+
+    Args:
+        fixture_products (dict): A dictionary representing products associated with the order.
+        copy_order (callable): A function returning a copy of an order.
+
+    Test that the copy of an order has the same products, transaction type, order type and total price.
+    """
+    order = Order(fixture_products, TransactionType.SELL, OrderType.ADD)
+
+    order_copy = copy_order(order)
+
+    assert [(product.name, product.price, quantity) for product, quantity in order_copy.products.items()] == \
+           [(product.name, product.price, quantity) for product, quantity in order.products.items()]
+    assert order_copy.transaction_type is order.transaction_type
+    assert order_copy.order_type is order.order_type
+    assert order_copy.total == order.total
+
+
 @pytest.mark.parametrize(
     'transaction_type, order_type, expected_error, expected_message',
     (
@@ -75,6 +119,8 @@ def test_valid_order_creation(fixture_products: dict, transaction_type: Transact
         (TransactionType.SELL, 'invalid_order_type', TypeError, ORDER_TYPE_ERROR_MSG),
         ('invalid_transaction_type', OrderType.REMOVE, TypeError, TRANSACTION_TYPE_ERROR_MSG),
         ('invalid_transaction_type', OrderType.REMOVE, TypeError, TRANSACTION_TYPE_ERROR_MSG),
+        ([], OrderType.ADD, TypeError, TRANSACTION_TYPE_ERROR_MSG),
+        (TransactionType.BUY, [], TypeError, ORDER_TYPE_ERROR_MSG),
     )
 )
 def test_invalid_order_creation(
@@ -120,26 +166,224 @@ def test_add_order_to_orders(fixture_orders: list):
         orders.add_order(order)
 
 
-def test_display_order_with_a_best_price(fixture_orders: list, capsys: pytest.fixture):
+def test_add_order_verbose(fixture_orders: list, capsys: pytest.fixture):
     """Test displaying the best orders with various inputs.
 
     Args:
         fixture_orders (list): A list of Order objects for testing.
         capsys (pytest.fixture): Pytest fixture for capturing stdout.
 
-    Test displaying the best orders for each transaction type based on total price.
+    Test that adding an order displays the best order of the added order's transaction type only.
     Verify the output matches the expected messages.
     """
     expected_output = 'Best Buy Order: ID = 1, Price = 9801.0\n' \
-                      'Best Buy Order: ID = 1, Price = 9801.0\n' \
                       'Best Buy Order: ID = 1, Price = 9801.0\n' \
                       'Best Sell Order: ID = 3, Price = 53.0\n' \
-                      'Best Buy Order: ID = 1, Price = 9801.0\n' \
                       'Best Sell Order: ID = 3, Price = 53.0\n'
     orders = Orders()
 
     for order in fixture_orders:
-        orders.add_order(order)
+        orders.add_order(order, verbose=True)
+    out, _ = capsys.readouterr()
+
+    assert out == expected_output
+
+
+def test_add_order_returns_best_order(fixture_orders: list, capsys: pytest.fixture):
+    """Test the value returned when adding orders to the Orders collection.
+
+    Args:
+        fixture_orders (list): A list of Order objects for testing.
+        capsys (pytest.fixture): Pytest fixture for capturing stdout.
+
+    Test that adding an order returns the best order of its transaction type,
+    and that nothing is displayed unless requested.
+    """
+    expected_results = [(1, 9801.0), (1, 9801.0), (3, 53.0), (3, 53.0)]
+    orders = Orders()
+
+    results = [orders.add_order(order) for order in fixture_orders]
+    out, _ = capsys.readouterr()
+
+    assert results == expected_results
+    assert out == ''
+
+    orders.display_best()
+    out, _ = capsys.readouterr()
+
+    assert out == 'Best Buy Order: ID = 1, Price = 9801.0\n' \
+                  'Best Sell Order: ID = 3, Price = 53.0\n'
+
+    orders.display_order_with_a_best_price()
+    out_alias, _ = capsys.readouterr()
+
+    assert out_alias == out
+
+
+def test_best_price_updated_by_later_order(capsys: pytest.fixture):
+    """Test that a later order with a higher total replaces the best order.
+
+    Args:
+        capsys (pytest.fixture): Pytest fixture for capturing stdout.
+
+    Test that the best order is updated as orders are added, and that an order with an equal total
+    does not replace the earlier one.
+    """
+    expected_output = 'Best Sell Order: ID = 1, Price = 2.0\n' \
+                      'Best Sell Order: ID = 2, Price = 6.0\n' \
+                      'Best Sell Order: ID = 2, Price = 6.0\n'
+    orders = Orders()
+
+    orders.add_order(Order({Product('Apple', 1.0): 2}, TransactionType.SELL, OrderType.ADD), verbose=True)
+    orders.add_order(Order({Product('Apple', 3.0): 2}, TransactionType.SELL, OrderType.ADD), verbose=True)
+    orders.add_order(Order({Product('Apple', 2.0): 3}, TransactionType.SELL, OrderType.ADD), verbose=True)
     out, _ = capsys.readouterr()
 
     assert out == expected_output
+
+
+def test_bulk_add(fixture_orders: list, capsys: pytest.fixture):
+    """Test adding many orders to the Orders collection at once.
+
+    Args:
+        fixture_orders (list): A list of Order objects for testing.
+        capsys (pytest.fixture): Pytest fixture for capturing stdout.
+
+    Test that all the orders are added in sequence, and the best orders are displayed only once.
+    Adding the same orders again does not replace the earlier best orders.
+    """
+    expected_output = 'Best Buy Order: ID = 1, Price = 9801.0\n' \
+                      'Best Sell Order: ID = 3, Price = 53.0\n'
+    orders = Orders()
+
+    orders.bulk_add(fixture_orders, verbose=True)
+    out, _ = capsys.readouterr()
+
+    assert orders.orders == fixture_orders
+    assert out == expected_output
+
+    orders.bulk_add(fixture_orders, verbose=True)
+    out, _ = capsys.readouterr()
+
+    assert orders.orders == fixture_orders * 2
+    assert out == expected_output
+
+    orders.bulk_add(order for order in fixture_orders)
+
+    assert orders.orders == fixture_orders * 3
+
+
+def test_remove_order(fixture_orders: list, capsys: pytest.fixture):
+    """Test removing orders from the Orders collection.
+
+    Args:
+        fixture_orders (list): A list of Order objects for testing.
+        capsys (pytest.fixture): Pytest fixture for capturing stdout.
+
+    Test that removing the best order promotes the next best order of the same transaction type,
+    removing another order keeps the best order, and a transaction type without orders is not displayed.
+    """
+    orders = Orders()
+    orders.bulk_add(fixture_orders)
+
+    assert orders.remove_order(2) == (1, 9801.0)
+    assert orders.remove_order(3) == (4, 0.9)
+    assert orders.remove_order(1) == (0, float('-inf'))
+
+    orders.display_best()
+    out, _ = capsys.readouterr()
+
+    assert out == 'Best Sell Order: ID = 4, Price = 0.9\n'
+    assert orders._get_next_id() == 5
+
+
+@pytest.mark.parametrize('order_id', (0, 2, 5, 1.0, '1'))
+def test_remove_invalid_order(fixture_orders: list, order_id: int):
+    """Test removing an order that is not in the Orders collection.
+
+    Args:
+        fixture_orders (list): A list of Order objects for testing.
+        order_id (int): The ID of an order that does not exist or has already been removed, or a non-integer ID.
+
+    Test that a ValueError is raised with the correct error message, and no order is removed.
+    """
+    orders = Orders()
+    orders.bulk_add(fixture_orders)
+    orders.remove_order(2)
+
+    with pytest.raises(ValueError) as error:
+        orders.remove_order(order_id)
+
+    assert str(error.value) == 'Invalid order ID. There is no order with this ID.'
+    assert orders._removed == {2}
+
+
+def test_recompute_all(fixture_orders: list):
+    """Test rebuilding the best orders from all the orders in the Orders collection.
+
+    Args:
+        fixture_orders (list): A list of Order objects for testing.
+
+    Test that removed orders are left out of the heaps, and the best orders are unchanged.
+    """
+    orders = Orders()
+    orders.bulk_add(fixture_orders)
+    orders.remove_order(2)
+    orders.remove_order(4)
+
+    orders.recompute_all()
+
+    assert orders._heaps == [[(-9801.0, 1)], [(-53.0, 3)]]
+    assert orders._best_id == [1, 3]
+    assert orders._best_total == [9801.0, 53.0]
+
+
+def test_bulk_add_to_orders_with_removed_orders(fixture_orders: list):
+    """Test adding many orders to an Orders collection that already has removed orders.
+
+    Args:
+        fixture_orders (list): A list of Order objects for testing.
+
+    Test that the best orders account for both the existing and the new orders,
+    and that removed orders never become the best ones again.
+    """
+    orders = Orders()
+    orders.bulk_add(fixture_orders)
+    orders.remove_order(1)
+    orders.remove_order(4)
+
+    orders.bulk_add([
+        Order({Product('Apple', 5.0): 1}, TransactionType.BUY, OrderType.ADD),
+        Order({Product('Apple', 10.0): 1}, TransactionType.SELL, OrderType.ADD),
+        Order({Product('Apple', 0.5): 1}, TransactionType.BUY, OrderType.ADD),
+    ])
+
+    assert orders._best_id == [5, 3]
+    assert orders._best_total == [5.0, 53.0]
+    assert orders.remove_order(3) == (6, 10.0)
+    assert orders.remove_order(5) == (2, 1.0)
+    assert orders.remove_order(2) == (7, 0.5)
+
+
+def test_add_remove_type_order(fixture_orders: list):
+    """Test adding an order with the "Remove" order type to the Orders collection.
+
+    Args:
+        fixture_orders (list): A list of Order objects for testing.
+
+    Test that a ValueError is raised with the correct error message by both add_order and bulk_add,
+    and that no order is added.
+    """
+    orders = Orders()
+    remove_order = Order({Product('Banana', 99.0): 100}, TransactionType.BUY, OrderType.REMOVE)
+
+    with pytest.raises(ValueError) as error:
+        orders.add_order(remove_order)
+
+    assert str(error.value) == 'Invalid order type. Only "Add" orders can be added.'
+
+    with pytest.raises(ValueError) as error:
+        orders.bulk_add(fixture_orders + [remove_order])
+
+    assert str(error.value) == 'Invalid order type. Only "Add" orders can be added.'
+    assert orders.orders == []